@@ -1,3 +1,55 @@
-from . import advanced_password_validation
+"""
+Django advanced password validation.
 
-__all__ = ["advanced_password_validation"]
+Submodules and validators are resolved lazily on first attribute access so that
+importing the package (e.g. while Django populates INSTALLED_APPS) stays cheap.
+"""
+
+import importlib
+
+_SUBMODULES = {"advanced_password_validation", "automaton", "normalization"}
+
+_VALIDATORS = {
+    "ContainsDigitsValidator": "advanced_password_validation",
+    "ContainsUppercaseValidator": "advanced_password_validation",
+    "ContainsLowercaseValidator": "advanced_password_validation",
+    "ContainsSpecialCharactersValidator": "advanced_password_validation",
+    "MaximumLengthValidator": "advanced_password_validation",
+    "MaxConsecutiveCharactersValidator": "advanced_password_validation",
+    "ConsecutivelyIncreasingDigitValidator": "advanced_password_validation",
+    "ConsecutivelyDecreasingDigitValidator": "advanced_password_validation",
+    "BannedSubstringValidator": "advanced_password_validation",
+    "NormalizedPasswordValidator": "advanced_password_validation",
+}
+
+__all__ = sorted(_SUBMODULES) + list(_VALIDATORS)
+
+
+def __getattr__(name):
+    """
+    Import submodules and validators on first access.
+
+    Args:
+        name (str): The attribute being looked up on the package.
+
+    Raises:
+        AttributeError: The package has no attribute called name.
+    """
+    if name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _VALIDATORS:
+        value = getattr(
+            importlib.import_module(f".{_VALIDATORS[name]}", __name__), name
+        )
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache on the package so __getattr__ is only hit once per name.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """
+    List the package attributes, including the lazily loaded ones.
+    """
+    return sorted(set(globals()) | set(__all__))
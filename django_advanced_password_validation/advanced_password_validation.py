@@ -2,10 +2,17 @@
 Advanced password validation
 """
 
-from django.core.exceptions import ValidationError
+import functools
+import os
+import threading
+
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.utils.text import format_lazy
 from django.utils.translation import ngettext_lazy
 from django.utils.translation import gettext_lazy
 
+from .normalization import normalize_password
+
 
 class ContainsDigitsValidator:
     """
@@ -185,7 +192,8 @@ class ContainsSpecialCharactersValidator:
             ValidationError: Password must contain at least {self.min_characters} special
                 character(s).
         """
-        if sum(c in set(self.characters) for c in password) < self.min_characters:
+        characters = set(self.characters)
+        if sum(c in characters for c in password) < self.min_characters:
             raise ValidationError(
                 ngettext_lazy(
                     "Password must contain at least %(min_characters)s special"
@@ -290,16 +298,18 @@ class MaxConsecutiveCharactersValidator:
             ValidationError: Password cannot contain consecutively repeating
                 characters. e.g 'aaa' or '111'
         """
+        run = 0
+        previous = None
         for c in password:
-            if password.count(c) >= self.max_consecutive:
-                check = c * (self.max_consecutive + 1)
-                if check in password:
-                    raise ValidationError(
-                        gettext_lazy(
-                            "Password contains consecutively repeating characters. "
-                            "e.g 'aaa' or '111'"
-                        )
+            run = run + 1 if c == previous else 1
+            previous = c
+            if run > self.max_consecutive:
+                raise ValidationError(
+                    gettext_lazy(
+                        "Password contains consecutively repeating characters. "
+                        "e.g 'aaa' or '111'"
                     )
+                )
 
     def get_help_text(self):
         """
@@ -311,6 +321,30 @@ class MaxConsecutiveCharactersValidator:
         )
 
 
+def _has_digit_sequence(password, step, max_consecutive):
+    """
+    Check in a single pass whether the password contains adjacent digits that change
+    by step at least max_consecutive times in a row.
+
+    Args:
+        password (str): The password to check.
+        step (int): 1 for increasing digits, -1 for decreasing digits.
+        max_consecutive (int): Maximum number of consecutive steps allowed.
+    """
+    run = 0
+    previous = None
+    for c in password:
+        if not c.isdecimal():
+            previous = None
+            continue
+        digit = int(c)
+        run = run + 1 if previous is not None and digit == previous + step else 0
+        previous = digit
+        if run and run >= max_consecutive:
+            return True
+    return False
+
+
 class ConsecutivelyIncreasingDigitValidator:
     """
     Validates whether the password contains consecutively increasing digits.
@@ -336,28 +370,12 @@ class ConsecutivelyIncreasingDigitValidator:
         Raises:
             ValidationError: Password contains consecutively increasing digits. e.g '12345'
         """
-        for c in password:
-            if c.isdigit():
-                count = 0
-                digit = int(c)
-                index = password.index(c)
-
-                try:
-                    for i in range(1, self.max_consecutive + 1):
-                        if password[index + i].isdigit():
-                            if int(password[index + i]) == digit + 1:
-                                count += 1
-                                digit += 1
-
-                                while count >= self.max_consecutive:
-                                    raise ValidationError(
-                                        gettext_lazy(
-                                            "Password contains consecutively increasing"
-                                            " digits. e.g '12345'"
-                                        )
-                                    )
-                except IndexError:
-                    pass
+        if _has_digit_sequence(password, 1, self.max_consecutive):
+            raise ValidationError(
+                gettext_lazy(
+                    "Password contains consecutively increasing digits. e.g '12345'"
+                )
+            )
 
     def get_help_text(self):
         """
@@ -393,28 +411,12 @@ class ConsecutivelyDecreasingDigitValidator:
         Raises:
             ValidationError: Password contains consecutively decreasing digits. e.g '54321'
         """
-        for c in password:
-            if c.isdigit():
-                count = 0
-                digit = int(c)
-                index = password.index(c)
-
-                try:
-                    for i in range(1, self.max_consecutive + 1):
-                        if password[index + i].isdigit():
-                            if int(password[index + i]) == digit - 1:
-                                count += 1
-                                digit -= 1
-
-                                while count >= self.max_consecutive:
-                                    raise ValidationError(
-                                        gettext_lazy(
-                                            "Password contains consecutively decreasing"
-                                            " digits. e.g '54321'"
-                                        )
-                                    )
-                except IndexError:
-                    pass
+        if _has_digit_sequence(password, -1, self.max_consecutive):
+            raise ValidationError(
+                gettext_lazy(
+                    "Password contains consecutively decreasing digits. e.g '54321'"
+                )
+            )
 
     def get_help_text(self):
         """
@@ -423,3 +425,224 @@ class ConsecutivelyDecreasingDigitValidator:
         return gettext_lazy(
             "Password cannot contain consecutively decreasing digits. e.g '54321'"
         )
+
+
+# Serializes building automatons so concurrent first requests do not each build one.
+# Validation itself only reads the finished automaton and never takes the lock.
+_automaton_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_banned_substring_automaton(terms, automaton_path=None):
+    """
+    Get the automaton for terms, building it at most once per process.
+
+    The file at automaton_path is only a cache: if it cannot be read, is malformed
+    or is stale, the automaton is rebuilt, and failing to write it is ignored.
+
+    Args:
+        terms (tuple): The normalized banned substrings.
+        automaton_path (str, optional): File to load a previously built automaton
+            from, and to write a freshly built one to. Defaults to None.
+
+    Returns:
+        AhoCorasickAutomaton: The automaton matching terms.
+    """
+    from .automaton import AhoCorasickAutomaton
+
+    if automaton_path is not None and os.path.exists(automaton_path):
+        try:
+            automaton = AhoCorasickAutomaton.load(automaton_path)
+        except (OSError, ValueError):
+            pass
+        else:
+            if automaton.terms == terms:
+                return automaton
+    automaton = AhoCorasickAutomaton(terms)
+    if automaton_path is not None:
+        try:
+            automaton.dump(automaton_path)
+        except OSError:
+            pass
+    return automaton
+
+
+class BannedSubstringValidator:
+    """
+    Validates whether the password contains any of the banned substrings.
+    """
+
+    def __init__(
+        self,
+        banned_substrings=(),
+        banned_substrings_path=None,
+        case_insensitive=True,
+        normalize_leetspeak=False,
+        automaton_path=None,
+    ):
+        """Initializes the validator.
+
+        Args:
+            banned_substrings (Iterable[str], optional): Substrings the password may
+                not contain. Defaults to ().
+            banned_substrings_path (str, optional): File with one banned substring
+                per line, optionally gzipped. Defaults to None.
+            case_insensitive (bool, optional): Whether to match regardless of case.
+                Defaults to True.
+            normalize_leetspeak (bool, optional): Whether to undo common leetspeak
+                substitutions (e.g. 'p@55w0rd') before matching. Defaults to False.
+            automaton_path (str, optional): File to cache the compiled automaton in
+                so that new worker processes can load it instead of rebuilding it.
+                Defaults to None.
+        """
+        self.banned_substrings = tuple(banned_substrings)
+        self.banned_substrings_path = banned_substrings_path
+        self.case_insensitive = case_insensitive
+        self.normalize_leetspeak = normalize_leetspeak
+        self.automaton_path = automaton_path
+        self._automaton = None
+
+    def normalize(self, text):
+        """
+        Normalize text the same way for both the banned substrings and the password.
+
+        Args:
+            text (str): The text to normalize.
+        """
+        normalizations = []
+        if self.case_insensitive:
+            normalizations.append("casefold")
+        if self.normalize_leetspeak:
+            normalizations.append("leetspeak")
+        return normalize_password(text, normalizations)
+
+    def get_automaton(self):
+        """
+        Get the automaton for the configured substrings. It is built (or loaded from
+        automaton_path) on first use rather than when the validator is created.
+        """
+        if self._automaton is not None:
+            return self._automaton
+        with _automaton_lock:
+            if self._automaton is not None:
+                return self._automaton
+            terms = list(self.banned_substrings)
+            if self.banned_substrings_path is not None:
+                import gzip
+
+                try:
+                    with gzip.open(
+                        self.banned_substrings_path, "rt", encoding="utf-8"
+                    ) as f:
+                        terms.extend(f.read().splitlines())
+                except (OSError, EOFError):
+                    try:
+                        with open(self.banned_substrings_path, encoding="utf-8") as f:
+                            terms.extend(f.read().splitlines())
+                    except (OSError, UnicodeDecodeError) as error:
+                        raise ImproperlyConfigured(
+                            "BannedSubstringValidator cannot read"
+                            f" banned_substrings_path {self.banned_substrings_path!r}:"
+                            f" {error}"
+                        ) from error
+            terms = tuple(
+                dict.fromkeys(
+                    term for term in map(self.normalize, map(str.strip, terms)) if term
+                )
+            )
+            self._automaton = _get_banned_substring_automaton(
+                terms, self.automaton_path
+            )
+            return self._automaton
+
+    def validate(self, password, user=None):
+        """
+        Validates whether the password contains any of the banned substrings.
+
+        Args:
+            password (str): The password to validate.
+            user (User): The user to validate the password for. (unused)
+
+        Raises:
+            ValidationError: Password contains a banned word or phrase.
+        """
+        if self.get_automaton().search(self.normalize(password)) is not None:
+            raise ValidationError(
+                gettext_lazy("Password contains a banned word or phrase."),
+                code="password_too_weak",
+            )
+
+    def get_help_text(self):
+        """
+        Get the help text for the validator.
+        """
+        return gettext_lazy("Your password cannot contain banned words or phrases.")
+
+
+class NormalizedPasswordValidator:
+    """
+    Normalizes the password once and runs the wrapped validators against the
+    normalized form, e.g. so that 'P@55w0rd' is checked as 'Password'.
+    """
+
+    def __init__(
+        self, validators=(), normalizations=("nfkc", "confusables", "leetspeak")
+    ):
+        """Initializes the validator.
+
+        Args:
+            validators (Iterable[dict], optional): Validators to run on the normalized
+                password, configured like AUTH_PASSWORD_VALIDATORS. Defaults to ().
+            normalizations (Iterable[str], optional): Normalizations to apply, in
+                order. One of 'nfkc', 'confusables', 'leetspeak' or 'casefold'.
+                Defaults to ('nfkc', 'confusables', 'leetspeak').
+
+        Raises:
+            ValueError: A normalization name is unknown.
+        """
+        self.normalizations = tuple(normalizations)
+        # Fail on misconfiguration when the settings are loaded, not on first use.
+        normalize_password("", self.normalizations)
+        # Imported here so that loading this module does not pull in
+        # django.contrib.auth and everything behind it.
+        from django.contrib.auth import password_validation
+
+        self.validators = password_validation.get_password_validators(validators)
+
+    def validate(self, password, user=None):
+        """
+        Validates the normalized password against every wrapped validator.
+
+        Args:
+            password (str): The password to validate.
+            user (User): The user to validate the password for.
+
+        Raises:
+            ValidationError: The errors raised by the wrapped validators.
+        """
+        from django.contrib.auth import password_validation
+
+        password_validation.validate_password(
+            normalize_password(password, self.normalizations), user, self.validators
+        )
+
+    def password_changed(self, password, user=None):
+        """
+        Forwards the normalized password to the wrapped validators.
+
+        Args:
+            password (str): The new password.
+            user (User): The user the password was changed for.
+        """
+        from django.contrib.auth import password_validation
+
+        password_validation.password_changed(
+            normalize_password(password, self.normalizations), user, self.validators
+        )
+
+    def get_help_text(self):
+        """
+        Get the help text for the validator.
+        """
+        help_texts = [validator.get_help_text() for validator in self.validators]
+        return format_lazy(" ".join(["{}"] * len(help_texts)), *help_texts)
@@ -0,0 +1,137 @@
+"""
+Aho-Corasick automaton for matching many substrings in a single pass
+"""
+
+import json
+import os
+import tempfile
+
+FORMAT_VERSION = 1
+
+# os.umask() can only be read by setting it, so do it once while the module is
+# imported rather than racing other threads creating files on every dump().
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+class AhoCorasickAutomaton:
+    """
+    Finds any of a fixed set of terms in a text in time linear in the length of the
+    text, regardless of how many terms there are.
+    """
+
+    def __init__(self, terms):
+        """Builds the automaton.
+
+        Args:
+            terms (Iterable[str]): The terms to search for. Empty terms are ignored.
+        """
+        self.terms = tuple(dict.fromkeys(term for term in terms if term))
+        # State 0 is the root. goto holds the trie edges, fail the failure links and
+        # match the index of a term ending at the state (directly or through its
+        # failure chain), or -1.
+        self.goto = [{}]
+        self.fail = [0]
+        self.match = [-1]
+
+        for index, term in enumerate(self.terms):
+            state = 0
+            for c in term:
+                if c not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.match.append(-1)
+                    self.goto[state][c] = len(self.goto) - 1
+                state = self.goto[state][c]
+            if self.match[state] == -1:
+                self.match[state] = index
+
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for c, child in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and c not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(c, 0)
+                if self.match[child] == -1:
+                    self.match[child] = self.match[self.fail[child]]
+                queue.append(child)
+
+    def search(self, text):
+        """
+        Scans text for the first occurrence of any term.
+
+        Args:
+            text (str): The text to scan.
+
+        Returns:
+            str: The first term found in the text, or None if there is none.
+        """
+        goto, fail, match = self.goto, self.fail, self.match
+        state = 0
+        for c in text:
+            while state and c not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(c, 0)
+            if match[state] != -1:
+                return self.terms[match[state]]
+        return None
+
+    def dump(self, path):
+        """
+        Serializes the automaton to path. The file is replaced atomically so that
+        concurrent readers never see a partial write.
+
+        Args:
+            path (str): The file to write the automaton to.
+        """
+        data = {
+            "version": FORMAT_VERSION,
+            "terms": self.terms,
+            "goto": self.goto,
+            "fail": self.fail,
+            "match": self.match,
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            # mkstemp() creates the file readable by its owner only; give it the
+            # usual permissions so workers running as other users can load it.
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads an automaton previously written with dump().
+
+        Args:
+            path (str): The file to read the automaton from.
+
+        Raises:
+            ValueError: The file is malformed or was written by an incompatible
+                version.
+
+        Returns:
+            AhoCorasickAutomaton: The deserialized automaton.
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported automaton format in {path!r}.")
+        if not all(
+            isinstance(data.get(key), list)
+            for key in ("terms", "goto", "fail", "match")
+        ) or not len(data["goto"]) == len(data["fail"]) == len(data["match"]):
+            raise ValueError(f"Malformed automaton in {path!r}.")
+        automaton = cls.__new__(cls)
+        automaton.terms = tuple(data["terms"])
+        automaton.goto = data["goto"]
+        automaton.fail = data["fail"]
+        automaton.match = data["match"]
+        return automaton
@@ -0,0 +1,191 @@
+"""
+Profile the configured password validators against a sample corpus
+"""
+
+import cProfile
+import json
+import time
+
+from django.contrib.auth.password_validation import (
+    get_default_password_validators,
+    validate_password,
+)
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+
+def _profile_rule(validator, corpus, repeat):
+    """
+    Time a validator on its own against every password in the corpus.
+
+    Args:
+        validator: The instantiated validator.
+        corpus (list): The sample passwords.
+        repeat (int): How many times to validate each password.
+
+    Returns:
+        dict: The cumulative time, rejection count and slowest input of the rule.
+    """
+    total = 0.0
+    rejections = 0
+    worst_time, worst_password = -1.0, None
+    for _ in range(repeat):
+        for password in corpus:
+            start = time.perf_counter()
+            try:
+                validator.validate(password)
+            except ValidationError:
+                rejections += 1
+            elapsed = time.perf_counter() - start
+            total += elapsed
+            if elapsed > worst_time:
+                worst_time, worst_password = elapsed, password
+    return {
+        "time": total,
+        "mean_time": total / (len(corpus) * repeat),
+        "rejections": rejections // repeat,
+        "worst_case": {
+            "password": worst_password,
+            "length": len(worst_password),
+            "time": worst_time,
+        },
+    }
+
+
+class Command(BaseCommand):
+    """
+    Profile AUTH_PASSWORD_VALIDATORS against a sample corpus.
+    """
+
+    help = (
+        "Time each of the AUTH_PASSWORD_VALIDATORS in isolation and as part of the "
+        "chain against a corpus of sample passwords. Writes a cProfile dump of the "
+        "chain run and a JSON summary with per-rule times, worst-case inputs and a "
+        "suggested ordering."
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add the command line arguments.
+
+        Args:
+            parser (ArgumentParser): The command's argument parser.
+        """
+        parser.add_argument(
+            "corpus", help="Text file with one sample password per line."
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=1,
+            help="Number of times to validate each password. Defaults to 1.",
+        )
+        parser.add_argument(
+            "--pstats",
+            default="profile_policy.pstats",
+            help="Where to write the cProfile dump of the chain run.",
+        )
+        parser.add_argument(
+            "--json",
+            default="profile_policy.json",
+            help="Where to write the JSON summary.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Profile the validators and write the reports.
+        """
+        try:
+            with open(options["corpus"], encoding="utf-8") as f:
+                corpus = [line for line in f.read().splitlines() if line]
+        except OSError as error:
+            raise CommandError(f"Cannot read corpus: {error}")
+        if not corpus:
+            raise CommandError("The corpus does not contain any passwords.")
+        if options["repeat"] < 1:
+            raise CommandError("--repeat must be at least 1.")
+        repeat = options["repeat"]
+        validators = get_default_password_validators()
+
+        # Load translations, word lists and other lazily built resources up front so
+        # their cost is not attributed to whichever rule happens to touch them first.
+        for password in corpus:
+            try:
+                validate_password(password, password_validators=validators)
+            except ValidationError:
+                pass
+
+        rules = []
+        for index, validator in enumerate(validators):
+            cls = type(validator)
+            rule = {"index": index, "name": f"{cls.__module__}.{cls.__qualname__}"}
+            rule.update(_profile_rule(validator, corpus, repeat))
+            rules.append(rule)
+
+        # Run the chain the way validate_password() does, timing each validator
+        # instance so that rules sharing a class, or wrapped in another validator,
+        # are attributed separately. This pass runs without the profiler, whose
+        # overhead would inflate each rule by a different amount.
+        chain_times = [0.0] * len(validators)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for password in corpus:
+                for index, validator in enumerate(validators):
+                    rule_start = time.perf_counter()
+                    try:
+                        validator.validate(password)
+                    except ValidationError:
+                        pass
+                    chain_times[index] += time.perf_counter() - rule_start
+        chain_time = time.perf_counter() - start
+
+        # A second pass under cProfile only produces the pstats dump.
+        profiler = cProfile.Profile()
+        profiler.enable()
+        for _ in range(repeat):
+            for password in corpus:
+                try:
+                    validate_password(password, password_validators=validators)
+                except ValidationError:
+                    pass
+        profiler.disable()
+        profiler.dump_stats(options["pstats"])
+
+        for rule, rule_chain_time in zip(rules, chain_times):
+            rule["chain_time"] = rule_chain_time
+
+        # Cheapest rejection first, then rules that never rejected by cost. Django
+        # runs every validator, so the ordering matters for chains that stop at the
+        # first failure and for the order the errors are reported in.
+        suggested_order = sorted(
+            rules,
+            key=lambda rule: (
+                rule["rejections"] == 0,
+                rule["time"] / (rule["rejections"] or 1),
+            ),
+        )
+        summary = {
+            "corpus_size": len(corpus),
+            "repeat": repeat,
+            "chain_time": chain_time,
+            "rules": rules,
+            "suggested_order": [rule["index"] for rule in suggested_order],
+        }
+        with open(options["json"], "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+        for rule in sorted(rules, key=lambda rule: rule["time"], reverse=True):
+            self.stdout.write(
+                f"{rule['time'] * 1000:10.3f} ms  {rule['rejections']:6d} rejected  "
+                f"worst {rule['worst_case']['time'] * 1e6:8.1f} us "
+                f"(length {rule['worst_case']['length']})  {rule['name']}"
+            )
+        self.stdout.write(
+            f"{chain_time * 1000:10.3f} ms  chain total ({len(corpus)}"
+            f" passwords x {repeat})"
+        )
+        self.stdout.write(
+            "Suggested order: "
+            + ", ".join(rules[index]["name"] for index in summary["suggested_order"])
+        )
+        self.stdout.write(f"Wrote {options['pstats']} and {options['json']}")
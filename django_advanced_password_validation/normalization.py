@@ -0,0 +1,92 @@
+"""
+Password normalization shared by the validators
+"""
+
+import unicodedata
+
+LEETSPEAK_TABLE = str.maketrans(
+    {
+        "0": "o",
+        "1": "i",
+        "3": "e",
+        "4": "a",
+        "5": "s",
+        "7": "t",
+        "8": "b",
+        "9": "g",
+        "@": "a",
+        "$": "s",
+        "!": "i",
+        "|": "l",
+        "+": "t",
+    }
+)
+
+# Cyrillic and Greek letters that render like Latin ones. Fullwidth forms,
+# ligatures and mathematical alphanumerics are already folded by NFKC.
+CONFUSABLES_TABLE = str.maketrans(
+    "АВЕКМНОРСТХаеорсухіјѕԁһӏ" "ΑΒΕΖΗΙΚΜΝΟΡΤΥΧαικνορτυχ",
+    "ABEKMHOPCTXaeopcyxijsdhl" "ABEZHIKMNOPTYXaikvoptux",
+)
+
+
+def _nfkc(password):
+    """
+    Apply Unicode NFKC compatibility folding.
+
+    Args:
+        password (str): The password to normalize.
+    """
+    return unicodedata.normalize("NFKC", password)
+
+
+def _confusables(password):
+    """
+    Replace Cyrillic and Greek look-alikes with their Latin counterparts.
+
+    Args:
+        password (str): The password to normalize.
+    """
+    return password.translate(CONFUSABLES_TABLE)
+
+
+def _leetspeak(password):
+    """
+    Undo common leetspeak substitutions, e.g. 'p@55w0rd' becomes 'password'.
+
+    Args:
+        password (str): The password to normalize.
+    """
+    return password.translate(LEETSPEAK_TABLE)
+
+
+NORMALIZATIONS = {
+    "nfkc": _nfkc,
+    "confusables": _confusables,
+    "leetspeak": _leetspeak,
+    "casefold": str.casefold,
+}
+
+
+def normalize_password(password, normalizations):
+    """
+    Apply normalizations to the password, in the given order.
+
+    Args:
+        password (str): The password to normalize.
+        normalizations (Iterable[str]): Names of the normalizations to apply. See
+            NORMALIZATIONS for the available names.
+
+    Raises:
+        ValueError: A normalization name is unknown.
+
+    Returns:
+        str: The normalized password.
+    """
+    for name in normalizations:
+        try:
+            normalization = NORMALIZATIONS[name]
+        except KeyError:
+            raise ValueError(f"Unknown password normalization {name!r}.") from None
+        password = normalization(password)
+    return password
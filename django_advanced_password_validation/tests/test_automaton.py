@@ -0,0 +1,96 @@
+"""
+Tests for the automaton module.
+"""
+
+import json
+import os
+import stat
+
+import pytest
+
+from ..automaton import AhoCorasickAutomaton
+
+
+def test_search():
+    """
+    Test that the automaton finds overlapping and nested terms.
+    """
+    automaton = AhoCorasickAutomaton(["he", "she", "his", "hers"])
+    assert automaton.search("ushers") == "she"
+    assert automaton.search("ahis") == "his"
+    assert automaton.search("hxexs") is None
+    assert automaton.search("") is None
+
+
+def test_search_through_failure_links():
+    """
+    Test that a match ending inside a longer partial match is found.
+    """
+    automaton = AhoCorasickAutomaton(["abcd", "bc"])
+    assert automaton.search("abcx") == "bc"
+    automaton = AhoCorasickAutomaton(["aaab"])
+    assert automaton.search("aaaaaaab") == "aaab"
+    assert automaton.search("aaaaaaaa") is None
+
+
+def test_empty_terms():
+    """
+    Test that empty and duplicate terms are ignored.
+    """
+    automaton = AhoCorasickAutomaton(["", "abc", "abc"])
+    assert automaton.terms == ("abc",)
+    assert AhoCorasickAutomaton([]).search("anything") is None
+
+
+def test_dump_and_load(tmp_path):
+    """
+    Test that a dumped automaton loads back with the same behaviour.
+    """
+    path = tmp_path / "automaton.json"
+    AhoCorasickAutomaton(["spring", "ring", "acmé"]).dump(str(path))
+    automaton = AhoCorasickAutomaton.load(str(path))
+    assert automaton.terms == ("spring", "ring", "acmé")
+    assert automaton.search("xxringxx") == "ring"
+    assert automaton.search("ACMÉ acmé") == "acmé"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_dump_file_mode(tmp_path):
+    """
+    Test that a dumped automaton gets the usual umask-based permissions rather than
+    the owner-only mode of a temporary file.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    path = tmp_path / "automaton.json"
+    AhoCorasickAutomaton(["acme"]).dump(str(path))
+    assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask
+
+
+def test_load_unsupported_version(tmp_path):
+    """
+    Test that loading a file of an unknown format raises a ValueError.
+    """
+    path = tmp_path / "automaton.json"
+    path.write_text(json.dumps({"version": 0}))
+    with pytest.raises(ValueError):
+        AhoCorasickAutomaton.load(str(path))
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [1],
+        {"version": 1},
+        {"version": 1, "terms": [], "goto": [{}], "fail": [0]},
+        {"version": 1, "terms": [], "goto": [{}], "fail": [], "match": [-1]},
+    ],
+)
+def test_load_malformed(tmp_path, data):
+    """
+    Test that loading a malformed file raises a ValueError.
+    """
+    path = tmp_path / "automaton.json"
+    path.write_text(json.dumps(data))
+    with pytest.raises(ValueError):
+        AhoCorasickAutomaton.load(str(path))
@@ -0,0 +1,174 @@
+"""
+Complexity regression tests: every validator must run in linear time on worst-case
+inputs.
+"""
+
+import math
+import time
+import timeit
+
+import pytest
+
+from ..advanced_password_validation import (
+    BannedSubstringValidator,
+    ConsecutivelyDecreasingDigitValidator,
+    ConsecutivelyIncreasingDigitValidator,
+    ContainsDigitsValidator,
+    ContainsLowercaseValidator,
+    ContainsSpecialCharactersValidator,
+    ContainsUppercaseValidator,
+    MaxConsecutiveCharactersValidator,
+    MaximumLengthValidator,
+    NormalizedPasswordValidator,
+)
+
+MODULE = "django_advanced_password_validation.advanced_password_validation"
+
+SIZES = (2_000, 4_000, 8_000, 16_000, 32_000)
+
+# Number of interleaved timing rounds; the fastest round per size is kept.
+ROUNDS = 7
+
+# Exponent of the fitted (validator time / reference scan time) ~ length ** k curve
+# above which growth is considered superlinear. Linear validators fit close to 0,
+# quadratic ones close to 1.
+MAX_EXPONENT = 0.5
+
+
+def _repeat_to(pattern, length):
+    """
+    Repeat pattern up to exactly length characters.
+
+    Args:
+        pattern (str): The pattern to repeat.
+        length (int): The length of the result.
+    """
+    return (pattern * (length // len(pattern) + 1))[:length]
+
+
+# Each case is a validator and a function building a worst-case password of the
+# given length that the validator accepts, so the whole input is always scanned.
+CASES = {
+    "digits": (ContainsDigitsValidator(), lambda n: "1" * n),
+    "uppercase": (ContainsUppercaseValidator(), lambda n: "A" * n),
+    "lowercase": (ContainsLowercaseValidator(), lambda n: "a" * n),
+    "special_characters": (ContainsSpecialCharactersValidator(), lambda n: "!" * n),
+    "maximum_length": (MaximumLengthValidator(max_length=10**6), lambda n: "a" * n),
+    "consecutive_alternating_runs": (
+        MaxConsecutiveCharactersValidator(),
+        lambda n: _repeat_to("aaabbb", n),
+    ),
+    "consecutive_distinct_runs": (
+        MaxConsecutiveCharactersValidator(),
+        lambda n: "".join(chr(0x4E00 + i // 3) for i in range(n)),
+    ),
+    "increasing_ladder": (
+        ConsecutivelyIncreasingDigitValidator(),
+        lambda n: "\U0001F600" * (n // 2) + _repeat_to("012", n - n // 2),
+    ),
+    "increasing_repeated_digits": (
+        ConsecutivelyIncreasingDigitValidator(),
+        lambda n: _repeat_to("012" + "9" * 6, n),
+    ),
+    "decreasing_ladder": (
+        ConsecutivelyDecreasingDigitValidator(),
+        lambda n: "\U0001F600" * (n // 2) + _repeat_to("210", n - n // 2),
+    ),
+    "decreasing_repeated_digits": (
+        ConsecutivelyDecreasingDigitValidator(),
+        lambda n: _repeat_to("987" + "0" * 6, n),
+    ),
+    "banned_substring_near_misses": (
+        BannedSubstringValidator(
+            banned_substrings=["a" * 64 + "b", "winter2024", "acme"]
+        ),
+        lambda n: "a" * n,
+    ),
+    "normalized_banned_substring": (
+        NormalizedPasswordValidator(
+            validators=[
+                {
+                    "NAME": f"{MODULE}.BannedSubstringValidator",
+                    "OPTIONS": {"banned_substrings": ["password"]},
+                }
+            ]
+        ),
+        lambda n: _repeat_to("P@55w0r", n),
+    ),
+}
+
+
+def _reference_scan(password):
+    """
+    Scan the password once in Python, as a known-linear baseline that is affected
+    by machine load in the same way as the validators.
+
+    Args:
+        password (str): The password to scan.
+    """
+    count = 0
+    for c in password:
+        if c == "\0":
+            count += 1
+    return count
+
+
+def _fit_exponent(sizes, times):
+    """
+    Fit time = c * size ** k by least squares on a log-log scale.
+
+    Args:
+        sizes (list): The input lengths.
+        times (list): The measured times for each length.
+
+    Returns:
+        float: The fitted exponent k.
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(t) for t in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_validator_runs_in_linear_time(case):
+    """
+    Test that the validator's runtime grows linearly with the password length on
+    its worst-case input.
+
+    Runs are timed in process CPU time, so time spent preempted by other processes
+    is not counted. Each validator run is also paired with a reference scan of the
+    same password, the sizes are interleaved across rounds and the fastest round
+    per size is kept, so that remaining noise (cache pressure, coverage tracing)
+    affects both sides alike instead of skewing the fit.
+    """
+    validator, build = CASES[case]
+    passwords = {size: build(size) for size in SIZES}
+    for size, password in passwords.items():
+        assert len(password) == size
+        assert validator.validate(password) is None
+    validator_times = {size: math.inf for size in SIZES}
+    reference_times = {size: math.inf for size in SIZES}
+    for _ in range(ROUNDS):
+        for size, password in passwords.items():
+            validator_times[size] = min(
+                validator_times[size],
+                timeit.Timer(
+                    lambda: validator.validate(password), timer=time.process_time
+                ).timeit(number=3),
+            )
+            reference_times[size] = min(
+                reference_times[size],
+                timeit.Timer(
+                    lambda: _reference_scan(password), timer=time.process_time
+                ).timeit(number=3),
+            )
+    ratios = [validator_times[size] / reference_times[size] for size in SIZES]
+    exponent = _fit_exponent(SIZES, ratios)
+    assert exponent < MAX_EXPONENT, (
+        f"{case} looks superlinear: time / reference ~ length ** {exponent:.2f}"
+        f" ({', '.join(f'{ratio:.2f}' for ratio in ratios)})"
+    )
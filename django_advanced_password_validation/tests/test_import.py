@@ -0,0 +1,98 @@
+"""
+Tests for the lazy loading and import-time footprint of the package.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import django_advanced_password_validation
+from .. import advanced_password_validation
+
+# Cold import budget for the top-level package, in microseconds. The package must
+# not pull in Django or any validator resources until they are actually used.
+IMPORT_TIME_BUDGET_US = 20_000
+
+# Cold import budget for the validators module that AUTH_PASSWORD_VALIDATORS names,
+# in microseconds. It needs Django's translation machinery, but not the auth app,
+# the ORM or the HTTP stack.
+VALIDATORS_IMPORT_TIME_BUDGET_US = 200_000
+VALIDATORS_MODULE = "django_advanced_password_validation.advanced_password_validation"
+
+PACKAGE_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+
+def _import_times(statement):
+    """
+    Run statement in a fresh interpreter with -X importtime.
+
+    Args:
+        statement (str): The Python statement to execute.
+
+    Returns:
+        dict: The cumulative import time in microseconds, keyed by module name.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=PACKAGE_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.partition(":")[2].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cold_import_within_budget():
+    """
+    Test that a cold import of the package stays within IMPORT_TIME_BUDGET_US and
+    does not import Django or the validators module.
+    """
+    times = _import_times("import django_advanced_password_validation")
+    assert times["django_advanced_password_validation"] < IMPORT_TIME_BUDGET_US
+    assert "django" not in times
+    assert VALIDATORS_MODULE not in times
+
+
+def test_validators_module_cold_import_within_budget():
+    """
+    Test that a cold import of the validators module stays within
+    VALIDATORS_IMPORT_TIME_BUDGET_US and does not import django.contrib.auth,
+    django.db or django.http.
+    """
+    times = _import_times(f"import {VALIDATORS_MODULE}")
+    assert times[VALIDATORS_MODULE] < VALIDATORS_IMPORT_TIME_BUDGET_US
+    for module in ("django.contrib.auth", "django.db", "django.http"):
+        assert module not in times
+
+
+def test_lazy_validator_access():
+    """
+    Test that validators are exposed on the package on first access.
+    """
+    assert (
+        django_advanced_password_validation.ContainsDigitsValidator
+        is advanced_password_validation.ContainsDigitsValidator
+    )
+    assert (
+        django_advanced_password_validation.advanced_password_validation
+        is advanced_password_validation
+    )
+    assert "MaximumLengthValidator" in dir(django_advanced_password_validation)
+
+
+def test_lazy_unknown_attribute():
+    """
+    Test that unknown attributes still raise an AttributeError.
+    """
+    with pytest.raises(AttributeError):
+        django_advanced_password_validation.DoesNotExistValidator
@@ -0,0 +1,49 @@
+"""
+Tests for the normalization module.
+"""
+
+import pytest
+
+from ..normalization import normalize_password
+
+
+def test_nfkc():
+    """
+    Test that compatibility characters are folded.
+    """
+    assert normalize_password("ＰＡＳＳ", ["nfkc"]) == "PASS"
+    assert normalize_password("ﬁle", ["nfkc"]) == "file"
+
+
+def test_confusables():
+    """
+    Test that Cyrillic and Greek look-alikes are replaced by Latin letters.
+    """
+    assert normalize_password("раѕѕwοrd", ["confusables"]) == "password"
+    assert normalize_password("ΑСМЕ", ["confusables"]) == "ACME"
+
+
+def test_leetspeak():
+    """
+    Test that leetspeak substitutions are undone.
+    """
+    assert normalize_password("P@55w0rd", ["leetspeak"]) == "Password"
+
+
+def test_chained_normalizations():
+    """
+    Test that normalizations are applied in the given order.
+    """
+    assert (
+        normalize_password("Ｐ@55wοrd", ["nfkc", "confusables", "leetspeak", "casefold"])
+        == "password"
+    )
+    assert normalize_password("P@55w0rd", []) == "P@55w0rd"
+
+
+def test_unknown_normalization():
+    """
+    Test that an unknown normalization raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        normalize_password("password", ["rot13"])
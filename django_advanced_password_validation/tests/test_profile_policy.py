@@ -0,0 +1,102 @@
+"""
+Tests for the profile_policy management command.
+"""
+
+import json
+import pstats
+from io import StringIO
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings
+
+MODULE = "django_advanced_password_validation.advanced_password_validation"
+
+
+def test_profile_policy(tmp_path):
+    """
+    Test that profile_policy writes a loadable pstats dump and a JSON summary with
+    an entry for every configured validator.
+    """
+    corpus_path = tmp_path / "corpus.txt"
+    corpus_path.write_text("Abc$d1234!\npassword\n\naaaaaaaaaaaaaaaaaaaa1234567\n")
+    pstats_path = tmp_path / "policy.pstats"
+    json_path = tmp_path / "policy.json"
+    stdout = StringIO()
+    call_command(
+        "profile_policy",
+        str(corpus_path),
+        repeat=2,
+        pstats=str(pstats_path),
+        json=str(json_path),
+        stdout=stdout,
+    )
+
+    pstats.Stats(str(pstats_path))
+    summary = json.loads(json_path.read_text())
+    assert summary["corpus_size"] == 3
+    assert summary["repeat"] == 2
+    assert len(summary["rules"]) == len(settings.AUTH_PASSWORD_VALIDATORS)
+    assert sorted(summary["suggested_order"]) == list(range(len(summary["rules"])))
+    rule = summary["rules"][4]
+    assert rule["name"].endswith(".ContainsDigitsValidator")
+    assert rule["rejections"] == 1
+    assert rule["worst_case"]["password"] in {
+        "Abc$d1234!",
+        "password",
+        "aaaaaaaaaaaaaaaaaaaa1234567",
+    }
+    assert rule["chain_time"] > 0
+    # The cheapest rule that rejects anything is suggested first.
+    assert summary["rules"][summary["suggested_order"][0]]["rejections"] > 0
+    assert "Suggested order:" in stdout.getvalue()
+
+
+@override_settings(
+    AUTH_PASSWORD_VALIDATORS=[
+        {
+            "NAME": f"{MODULE}.MaxConsecutiveCharactersValidator",
+            "OPTIONS": {"max_consecutive": 3},
+        },
+        {
+            "NAME": f"{MODULE}.MaxConsecutiveCharactersValidator",
+            "OPTIONS": {"max_consecutive": 5},
+        },
+    ]
+)
+def test_profile_policy_same_class_twice(tmp_path):
+    """
+    Test that chain time is attributed to each configured validator rather than
+    combined for validators of the same class.
+    """
+    corpus_path = tmp_path / "corpus.txt"
+    corpus_path.write_text("Abc$d1234!\naaaa1234!\n" + "ab" * 500 + "\n")
+    json_path = tmp_path / "policy.json"
+    call_command(
+        "profile_policy",
+        str(corpus_path),
+        pstats=str(tmp_path / "policy.pstats"),
+        json=str(json_path),
+        stdout=StringIO(),
+    )
+
+    summary = json.loads(json_path.read_text())
+    first, second = summary["rules"]
+    assert first["rejections"] == 1
+    assert second["rejections"] == 0
+    assert first["chain_time"] > 0
+    assert second["chain_time"] > 0
+    assert first["chain_time"] != second["chain_time"]
+    assert first["chain_time"] + second["chain_time"] <= summary["chain_time"]
+
+
+def test_profile_policy_empty_corpus(tmp_path):
+    """
+    Test that profile_policy fails on a corpus without passwords.
+    """
+    corpus_path = tmp_path / "corpus.txt"
+    corpus_path.write_text("\n")
+    with pytest.raises(CommandError):
+        call_command("profile_policy", str(corpus_path))
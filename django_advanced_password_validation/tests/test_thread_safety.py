@@ -0,0 +1,185 @@
+"""
+Thread safety tests and thread-scaling benchmark for the validators.
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.contrib.auth.password_validation import (
+    get_password_validators,
+    validate_password,
+)
+from django.core.exceptions import ValidationError
+
+from ..advanced_password_validation import (
+    BannedSubstringValidator,
+    _get_banned_substring_automaton,
+)
+
+MODULE = "django_advanced_password_validation.advanced_password_validation"
+
+# Every validator in the package, as a policy would configure them.
+CHAIN = [
+    {"NAME": f"{MODULE}.ContainsDigitsValidator"},
+    {"NAME": f"{MODULE}.ContainsUppercaseValidator"},
+    {"NAME": f"{MODULE}.ContainsLowercaseValidator"},
+    {"NAME": f"{MODULE}.ContainsSpecialCharactersValidator"},
+    {"NAME": f"{MODULE}.MaximumLengthValidator"},
+    {"NAME": f"{MODULE}.MaxConsecutiveCharactersValidator"},
+    {"NAME": f"{MODULE}.ConsecutivelyIncreasingDigitValidator"},
+    {"NAME": f"{MODULE}.ConsecutivelyDecreasingDigitValidator"},
+    {
+        "NAME": f"{MODULE}.BannedSubstringValidator",
+        "OPTIONS": {"banned_substrings": ["acme", "rocket", "winter2024"]},
+    },
+    {
+        "NAME": f"{MODULE}.NormalizedPasswordValidator",
+        "OPTIONS": {
+            "validators": [
+                {
+                    "NAME": f"{MODULE}.BannedSubstringValidator",
+                    "OPTIONS": {"banned_substrings": ["password", "letmein"]},
+                },
+            ],
+        },
+    },
+]
+
+CORPUS = [
+    "Abc$d1234!",
+    "P@55w0rd!x",
+    "aaaaBBBB1!",
+    "9876Zz!yx",
+    "Winter2024!",
+    "Secure#Pass7",
+    "ＡＣＭＥ$rocks1",
+    "l3tm31n!Q",
+    "",
+    "correct horse battery staple",
+]
+
+# Total validations per benchmark run, split evenly across the threads.
+BENCHMARK_VALIDATIONS = 4000
+BENCHMARK_THREADS = (1, 2, 4, 8)
+
+
+def _messages(validators, password):
+    """
+    Run the chain on password and return its error messages.
+
+    Args:
+        validators (list): The instantiated validators.
+        password (str): The password to validate.
+    """
+    try:
+        validate_password(password, password_validators=validators)
+    except ValidationError as error:
+        return tuple(error.messages)
+    return ()
+
+
+def _gil_enabled():
+    """
+    Whether the interpreter serializes Python threads with the GIL.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or is_gil_enabled()
+
+
+def measure_throughput(validators, threads):
+    """
+    Measure the combined chain validations per second of the given threads.
+
+    Args:
+        validators (list): The instantiated validators, shared by all threads.
+        threads (int): The number of threads to validate on.
+
+    Returns:
+        float: Validations per second.
+    """
+    per_thread = BENCHMARK_VALIDATIONS // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def work():
+        barrier.wait()
+        for i in range(per_thread):
+            _messages(validators, CORPUS[i % len(CORPUS)])
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = [executor.submit(work) for _ in range(threads)]
+        barrier.wait()
+        start = time.perf_counter()
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - start
+    return per_thread * threads / elapsed
+
+
+def test_concurrent_validation():
+    """
+    Test that validators shared across threads give the same results as when they
+    are used from a single thread.
+    """
+    validators = get_password_validators(CHAIN)
+    expected = [_messages(validators, password) for password in CORPUS]
+
+    def work(_):
+        return [_messages(validators, password) for password in CORPUS * 20]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for results in executor.map(work, range(16)):
+            assert results == expected * 20
+
+
+def test_concurrent_automaton_build():
+    """
+    Test that threads racing on a validator's first use build its automaton once
+    and all see the same one.
+    """
+    validator = BannedSubstringValidator(banned_substrings=["concurrent-build"])
+    barrier = threading.Barrier(8)
+    misses = _get_banned_substring_automaton.cache_info().misses
+
+    def work(_):
+        barrier.wait()
+        return validator.get_automaton()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        automatons = set(map(id, executor.map(work, range(8))))
+    assert len(automatons) == 1
+    assert _get_banned_substring_automaton.cache_info().misses == misses + 1
+
+
+@pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run"
+)
+def test_thread_scaling_benchmark(record_property):
+    """
+    Benchmark the full chain on 1, 2, 4 and 8 threads sharing the same validators.
+
+    With the GIL, threads cannot run the pure Python validators in parallel, so the
+    test only checks that throughput does not collapse under contention. On a
+    free-threaded build it also checks that adding threads increases throughput,
+    which fails if a lock serializes validation. The throughput for each thread
+    count is recorded as a test property, e.g. in the --junitxml report.
+    """
+    validators = get_password_validators(CHAIN)
+    _messages(validators, CORPUS[0])  # Warm up the lazily built resources.
+    throughput = {
+        threads: measure_throughput(validators, threads)
+        for threads in BENCHMARK_THREADS
+    }
+    for threads, rate in throughput.items():
+        record_property(f"validations_per_second_{threads}_threads", round(rate))
+    summary = ", ".join(
+        f"{threads} thread(s): {rate:,.0f}/s" for threads, rate in throughput.items()
+    )
+
+    for threads in BENCHMARK_THREADS:
+        assert throughput[threads] > 0.5 * throughput[1], summary
+    if not _gil_enabled() and (os.cpu_count() or 1) >= 4:
+        assert throughput[4] > 2 * throughput[1], summary
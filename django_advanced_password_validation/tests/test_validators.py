@@ -2,11 +2,15 @@
 Tests for the advanced_password_validation module.
 """
 
+import gzip
+import json
+
 import pytest
 from django.contrib.auth.password_validation import validate_password
-from django.core.exceptions import ValidationError
+from django.core.exceptions import ImproperlyConfigured, ValidationError
 
 from ..advanced_password_validation import (
+    BannedSubstringValidator,
     ConsecutivelyDecreasingDigitValidator,
     ConsecutivelyIncreasingDigitValidator,
     ContainsDigitsValidator,
@@ -15,6 +19,7 @@ from ..advanced_password_validation import (
     ContainsUppercaseValidator,
     MaxConsecutiveCharactersValidator,
     MaximumLengthValidator,
+    NormalizedPasswordValidator,
 )
 
 
@@ -200,6 +205,10 @@ def test_consecutively_increasing_digit_validator():
         exc.value.message
         == "Password contains consecutively increasing digits. e.g '12345'"
     )
+    # Sequences after an earlier occurrence of their first digit are found too.
+    with pytest.raises(ValidationError):
+        validator.validate("1x1234")
+    assert validator.validate("12x34x²³⁴⁵") is None
 
 
 def test_consecutively_increasing_digit_get_help_text():
@@ -228,6 +237,9 @@ def test_consecutively_decreasing_digit_validator():
         exc.value.message
         == "Password contains consecutively decreasing digits. e.g '54321'"
     )
+    with pytest.raises(ValidationError):
+        validator.validate("4x4321")
+    assert validator.validate("43x21x⁵⁴³²") is None
 
 
 def test_consecutively_decreasing_digit_get_help_text():
@@ -241,6 +253,238 @@ def test_consecutively_decreasing_digit_get_help_text():
     )
 
 
+def test_banned_substring_validator():
+    """
+    Test that the BannedSubstringValidator works as expected and raises a
+    ValidationError when the password contains a banned substring.
+    """
+    validator = BannedSubstringValidator(banned_substrings=["acme", "Winter2024"])
+    assert validator.validate("Abc$d1234!") is None
+    with pytest.raises(ValidationError) as exc:
+        validator.validate("myACMEpass!")
+    assert exc.value.code == "password_too_weak"
+    assert exc.value.message == "Password contains a banned word or phrase."
+    with pytest.raises(ValidationError):
+        validator.validate("xwinter2024x")
+    validator = BannedSubstringValidator(
+        banned_substrings=["acme"], case_insensitive=False
+    )
+    assert validator.validate("myACMEpass!") is None
+
+
+def test_banned_substring_validator_leetspeak():
+    """
+    Test that the BannedSubstringValidator undoes leetspeak substitutions when
+    normalize_leetspeak is set.
+    """
+    validator = BannedSubstringValidator(banned_substrings=["password"])
+    assert validator.validate("P@55w0rd") is None
+    validator = BannedSubstringValidator(
+        banned_substrings=["password"], normalize_leetspeak=True
+    )
+    with pytest.raises(ValidationError):
+        validator.validate("P@55w0rd")
+
+
+def test_banned_substring_validator_files(tmp_path):
+    """
+    Test that the BannedSubstringValidator reads banned substrings from a file and
+    caches the compiled automaton on disk.
+    """
+    banned_substrings_path = tmp_path / "banned.txt"
+    banned_substrings_path.write_text("acme\n\n  rocket  \n")
+    automaton_path = tmp_path / "banned.json"
+    validator = BannedSubstringValidator(
+        banned_substrings_path=str(banned_substrings_path),
+        automaton_path=str(automaton_path),
+    )
+    with pytest.raises(ValidationError):
+        validator.validate("Rocket$1234")
+    assert automaton_path.exists()
+    validator = BannedSubstringValidator(
+        banned_substrings_path=str(banned_substrings_path),
+        automaton_path=str(automaton_path),
+    )
+    assert validator.get_automaton().terms == ("acme", "rocket")
+    # A cached automaton built from a different word list is rebuilt.
+    validator = BannedSubstringValidator(
+        banned_substrings=["launch"], automaton_path=str(automaton_path)
+    )
+    assert validator.validate("Rocket$1234") is None
+    with pytest.raises(ValidationError):
+        validator.validate("Launch$1234")
+
+
+def test_banned_substring_validator_file_encoding(tmp_path):
+    """
+    Test that banned substring files are read as UTF-8, whether gzipped or not.
+    """
+    plain_path = tmp_path / "banned.txt"
+    plain_path.write_bytes("acmé\n".encode("utf-8"))
+    gzip_path = tmp_path / "banned.txt.gz"
+    with gzip.open(gzip_path, "wb") as f:
+        f.write("rocké\n".encode("utf-8"))
+    for path, password in ((plain_path, "xACMÉx"), (gzip_path, "xROCKÉx")):
+        validator = BannedSubstringValidator(banned_substrings_path=str(path))
+        with pytest.raises(ValidationError):
+            validator.validate(password)
+
+
+def test_banned_substring_validator_unreadable_file(tmp_path):
+    """
+    Test that a corrupt or missing banned substrings file is reported as a
+    configuration error naming the file.
+    """
+    path = tmp_path / "banned.txt.gz"
+    path.write_bytes(gzip.compress(b"truncated\n")[:12])
+    for banned_substrings_path in (path, tmp_path / "missing.txt"):
+        validator = BannedSubstringValidator(
+            banned_substrings_path=str(banned_substrings_path)
+        )
+        with pytest.raises(ImproperlyConfigured) as exc:
+            validator.validate("Abc$d1234!")
+        assert str(banned_substrings_path) in str(exc.value)
+
+
+def test_banned_substring_validator_unwritable_automaton_path(tmp_path):
+    """
+    Test that the BannedSubstringValidator still validates when the automaton cannot
+    be written to automaton_path.
+    """
+    automaton_path = tmp_path / "missing-dir" / "banned.json"
+    validator = BannedSubstringValidator(
+        banned_substrings=["unwritable"], automaton_path=str(automaton_path)
+    )
+    with pytest.raises(ValidationError):
+        validator.validate("Unwritable$1")
+    assert validator.validate("Abc$d1234!") is None
+    assert not automaton_path.exists()
+
+
+@pytest.mark.parametrize(
+    "content",
+    ['{"version": 1}', "[1]", "not json", '{"version": 1, "terms": 1}'],
+)
+def test_banned_substring_validator_malformed_automaton(tmp_path, content):
+    """
+    Test that a malformed automaton file is treated as stale and rebuilt.
+    """
+    automaton_path = tmp_path / "banned.json"
+    automaton_path.write_text(content)
+    validator = BannedSubstringValidator(
+        banned_substrings=[f"malformed{len(content)}"],
+        automaton_path=str(automaton_path),
+    )
+    with pytest.raises(ValidationError):
+        validator.validate(f"xMalformed{len(content)}x")
+    assert validator.get_automaton().terms == (f"malformed{len(content)}",)
+    assert json.loads(automaton_path.read_text())["terms"] == [
+        f"malformed{len(content)}"
+    ]
+
+
+def test_banned_substring_get_help_text():
+    """
+    Test that the get_help_text string works as expected.
+    """
+    validator = BannedSubstringValidator()
+    assert (
+        validator.get_help_text()
+        == "Your password cannot contain banned words or phrases."
+    )
+
+
+def test_normalized_password_validator():
+    """
+    Test that the NormalizedPasswordValidator runs the wrapped validators on the
+    normalized password and collects all of their errors.
+    """
+    validator = NormalizedPasswordValidator(
+        validators=[
+            {
+                "NAME": "django_advanced_password_validation.advanced_password_validation"
+                ".BannedSubstringValidator",
+                "OPTIONS": {"banned_substrings": ["password"]},
+            },
+            {
+                "NAME": "django_advanced_password_validation.advanced_password_validation"
+                ".ContainsUppercaseValidator",
+            },
+        ],
+    )
+    assert validator.validate("Secure$Pa55") is None
+    with pytest.raises(ValidationError) as exc:
+        validator.validate("p@55w0rd")
+    assert exc.value.messages == [
+        "Password contains a banned word or phrase.",
+        "Password must contain at least 1 uppercase character.",
+    ]
+    with pytest.raises(ValueError):
+        NormalizedPasswordValidator(normalizations=["rot13"])
+
+
+class RecordingValidator:
+    """
+    Validator that records the passwords it is notified about.
+    """
+
+    def __init__(self):
+        """Initializes the validator."""
+        self.changed = []
+
+    def validate(self, password, user=None):
+        """
+        Accepts every password.
+        """
+
+    def password_changed(self, password, user=None):
+        """
+        Records the changed password and user.
+        """
+        self.changed.append((password, user))
+
+
+def test_normalized_password_password_changed():
+    """
+    Test that password_changed() forwards the normalized password to the wrapped
+    validators.
+    """
+    validator = NormalizedPasswordValidator(
+        validators=[
+            {
+                "NAME": "django_advanced_password_validation.tests.test_validators"
+                ".RecordingValidator",
+            },
+        ],
+    )
+    user = object()
+    validator.password_changed("P@55w0rd", user)
+    assert validator.validators[0].changed == [("Password", user)]
+
+
+def test_normalized_password_get_help_text():
+    """
+    Test that the get_help_text string joins the wrapped validators' help texts.
+    """
+    validator = NormalizedPasswordValidator(
+        validators=[
+            {
+                "NAME": "django_advanced_password_validation.advanced_password_validation"
+                ".BannedSubstringValidator",
+            },
+            {
+                "NAME": "django_advanced_password_validation.advanced_password_validation"
+                ".ContainsDigitsValidator",
+            },
+        ],
+    )
+    assert (
+        validator.get_help_text()
+        == "Your password cannot contain banned words or phrases. Your password must"
+        " contain at least 1 number."
+    )
+
+
 def test_valid_password():
     """
     Test that the validate_password function works as expected.